@@ -6,6 +6,7 @@ import { chatRateLimiter } from '@/lib/rateLimiter';
 import { getCorsHeaders } from '@/lib/corsHeaders';
 import { withSecurityHeaders } from '@/lib/securityHeaders';
 import { logger } from '@/lib/logger';
+import { validateEnvironment } from '@/lib/envMiddleware';
 
 // Input sanitization helper
 function sanitizeInput(input: string): string {
@@ -33,7 +34,6 @@ function getClientIP(req: NextRequest): string {
 
 export async function POST(req: NextRequest) {
   // Validate environment variables first
-  const { validateEnvironment } = await import('@/lib/envMiddleware');
   const envError = validateEnvironment();
   if (envError) {
     return envError;
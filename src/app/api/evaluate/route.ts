@@ -8,115 +8,61 @@ import { extractJobRequirements } from '@/lib/requirementExtractor';
 import { evaluateCandidate } from '@/lib/candidateEvaluator';
 import { evaluateCandidateV2 } from '@/lib/candidateEvaluatorV2';
 import { preprocessResume, estimateTokens } from '@/lib/resumePreprocessor';
+import { EnhancedJobRequirements, EvaluationResult, JobType } from '@/types';
 
-import { PdfReader } from 'pdfreader';
 import { logger } from '@/lib/logger';
 import { LRUCache } from '@/lib/lruCache';
 import { getCorsHeaders } from '@/lib/corsHeaders';
 import { withSecurityHeaders } from '@/lib/securityHeaders';
-
-async function parsePdf(buffer: Buffer): Promise<string> {
-  return new Promise((resolve, reject) => {
-    let content = "";
-    let itemCount = 0;
-    let pageCount = 0;
-    const startTime = Date.now();
-    const contentParts: string[] = [];
-    
-    // Safety timeout for PDF parsing (9 seconds for Vercel compatibility)
-    const timeout = setTimeout(() => {
-      logger.warn('PDF parsing taking too long, returning partial content', {
-        itemCount,
-        pageCount,
-        contentLength: content.length
-      });
-      resolve(content.trim() || contentParts.join(' ').trim());
-    }, 9000);
-    
-    try {
-      new PdfReader(null).parseBuffer(buffer, (err, item) => {
-        if (err) {
-          clearTimeout(timeout);
-          logger.error('PDF parsing failed', err, { 
-            fileType: 'pdf',
-            bufferSize: buffer.length,
-            itemsProcessed: itemCount,
-            pagesProcessed: pageCount
-          });
-          
-          // Return partial content if available
-          const partialContent = content.trim() || contentParts.join(' ').trim();
-          if (partialContent.length > 100) {
-            logger.info('Returning partial PDF content after error', {
-              contentLength: partialContent.length
-            });
-            resolve(partialContent);
-          } else {
-            reject(new Error(`PDF parsing error: ${err.message || 'Unknown error'}`));
-          }
-        } else if (!item) {
-          // End of buffer, PDF parsing is finished.
-          clearTimeout(timeout);
-          const duration = Date.now() - startTime;
-          const finalContent = content.trim() || contentParts.join(' ').trim();
-          
-          logger.info('PDF parsing completed', { 
-            itemCount, 
-            pageCount,
-            contentLength: finalContent.length,
-            duration,
-            averageItemsPerPage: pageCount > 0 ? Math.round(itemCount / pageCount) : 0
-          });
-          
-          resolve(finalContent);
-        } else if (item.text) {
-          itemCount++;
-          const text = item.text.trim();
-          if (text) {
-            content += text + " ";
-            contentParts.push(text);
-          }
-        } else if (item.page) {
-          pageCount = item.page;
-          // Add page break for better text structure
-          content += "\n\n";
-        }
-      });
-    } catch (parseError) {
-      clearTimeout(timeout);
-      logger.error('PDF parser threw exception', parseError);
-      reject(new Error('PDF parser exception'));
-    }
-  });
-}
+import { validateEnvironment } from '@/lib/envMiddleware';
+import { parsePdf } from '@/lib/pdfParser';
 
 // In-memory cache for evaluation results with LRU eviction and TTL
 // Max 100 entries, 60 minutes TTL
-const evaluationCache = new LRUCache<string, Record<string, unknown>>(100, 60);
+const evaluationCache = new LRUCache<string, EvaluationResult>(100, 60);
+
+// Job analysis keyed by job description hash, so re-screening against the
+// same posting skips both OpenAI calls. Max 20 entries, 60 minutes TTL
+const jobAnalysisCache = new LRUCache<string, { jobType: JobType; jobRequirements: EnhancedJobRequirements }>(20, 60);
 
 // Limit concurrency for file parsing - optimized for stability
 const parsingLimit = pLimit(3); // Reduced to prevent memory issues
+// Limit concurrent OpenAI evaluations so a batch doesn't burst into rate limits
+const evaluationLimit = pLimit(3);
 const BATCH_SIZE = 5; // Process resumes in smaller batches
 
 // Helper to encode SSE messages
 const encoder = new TextEncoder();
 function createSseStream(data: unknown, eventName?: string) {
-  let message = `data: ${JSON.stringify(data)}\n\n`;
-  if (eventName) {
-    message = `event: ${eventName}\n${message}`;
-  }
-  return encoder.encode(message);
+  // One template per frame; the payload can carry ~1MB of resume text
+  const eventLine = eventName ? `event: ${eventName}\n` : '';
+  return encoder.encode(`${eventLine}data: ${JSON.stringify(data)}\n\n`);
+}
+
+interface ParsedResume {
+  fileName: string;
+  text: string;
+  hash: string;
+  cached?: EvaluationResult;
+  error?: string;
 }
 
-async function parseResume(file: File): Promise<{ fileName: string; text: string; buffer: Buffer; error?: string }> {
+async function parseResume(file: File): Promise<ParsedResume> {
   const fileBuffer = Buffer.from(await file.arrayBuffer());
+  const hash = createHash('sha256').update(fileBuffer).digest('hex');
+
+  // Identical uploads (re-runs or duplicate files) skip text extraction entirely
+  const cached = evaluationCache.get(hash);
+  if (cached) {
+    return { fileName: file.name, text: '', hash, cached };
+  }
   
   // Add timeout protection for parsing (30 seconds per file)
   const parseWithTimeout = async (): Promise<string> => {
     return Promise.race([
       (async () => {
         if (file.type === 'application/pdf') {
-          return await parsePdf(fileBuffer);
+          return await parsePdf(fileBuffer, { allowPartial: true });
         } else if (file.type === 'application/vnd.openxmlformats-officedocument.wordprocessingml.document') {
           const { value } = await mammoth.extractRawText({ buffer: fileBuffer });
           return value;
@@ -145,7 +91,7 @@ async function parseResume(file: File): Promise<{ fileName: string; text: string
       return { 
         fileName: file.name, 
         text: '', 
-        buffer: fileBuffer, 
+        hash, 
         error: 'File appears to be empty or could not extract text' 
       };
     }
@@ -166,7 +112,7 @@ async function parseResume(file: File): Promise<{ fileName: string; text: string
       wordCount: text.split(/\s+/).length
     });
     
-    return { fileName: file.name, text, buffer: fileBuffer };
+    return { fileName: file.name, text, hash };
   } catch (error) {
     const errorMessage = error instanceof Error ? error.message : String(error);
     
@@ -189,13 +135,12 @@ async function parseResume(file: File): Promise<{ fileName: string; text: string
       userFriendlyError = 'PDF parsing error - file may be corrupted or use unsupported features';
     }
     
-    return { fileName: file.name, text: '', buffer: fileBuffer, error: userFriendlyError };
+    return { fileName: file.name, text: '', hash, error: userFriendlyError };
   }
 }
 
 export async function POST(req: NextRequest) {
   // Validate environment variables first
-  const { validateEnvironment } = await import('@/lib/envMiddleware');
   const envError = validateEnvironment();
   if (envError) {
     return envError;
@@ -229,13 +174,38 @@ export async function POST(req: NextRequest) {
     }
   }
 
+  // Set once the stream has finished, failed or been cancelled by the client;
+  // queued parses then skip their work and free the shared parsing slots
+  let streamClosed = false;
+
   const stream = new ReadableStream({
     async start(controller) {
+      // Parse a batch of resumes with limited concurrency
+      const parseBatch = (start: number) => Promise.all(
+        files.slice(start, Math.min(start + BATCH_SIZE, files.length))
+          .map(file => parsingLimit(() => streamClosed
+            ? Promise.resolve<ParsedResume>({ fileName: file.name, text: '', hash: '', error: 'Request closed' })
+            : parseResume(file)))
+      );
+
+      // Resume parsing doesn't depend on the job analysis, so start the
+      // first batch now and let it overlap the OpenAI round-trips below
+      let pendingBatch = parseBatch(0);
+
       try {
         // Step 1: Analyze Job Description
         controller.enqueue(createSseStream({ message: 'Analyzing job description...' }, 'status_update'));
-        const jobType = await detectJobType(jobDescription);
-        const jobRequirements = await extractJobRequirements(jobDescription, jobType);
+        const jobHash = createHash('sha256').update(jobDescription).digest('hex');
+        let jobAnalysis = jobAnalysisCache.get(jobHash);
+        if (!jobAnalysis) {
+          const detectedJobType = await detectJobType(jobDescription);
+          jobAnalysis = {
+            jobType: detectedJobType,
+            jobRequirements: await extractJobRequirements(jobDescription, detectedJobType)
+          };
+          jobAnalysisCache.set(jobHash, jobAnalysis);
+        }
+        const { jobType, jobRequirements } = jobAnalysis;
         
         // Send initial job info to the client
         controller.enqueue(createSseStream({ jobType, jobRequirements }, 'job_info'));
@@ -250,6 +220,10 @@ export async function POST(req: NextRequest) {
           total: totalFiles 
         }, 'status_update'));
 
+        // Evaluations in progress for this request, keyed by file hash, so
+        // duplicate uploads within a batch share one OpenAI call
+        const inFlightEvaluations = new Map<string, Promise<EvaluationResult>>();
+
         // Process files in batches
         for (let i = 0; i < files.length; i += BATCH_SIZE) {
           const batch = files.slice(i, Math.min(i + BATCH_SIZE, files.length));
@@ -262,30 +236,35 @@ export async function POST(req: NextRequest) {
             total: totalFiles
           }, 'progress_update'));
 
-          // Parse batch of resumes with limited concurrency
-          const parsedBatch = await Promise.all(
-            batch.map(file => parsingLimit(() => parseResume(file)))
-          );
+          const parsedBatch = await pendingBatch;
 
-          // Process each resume in the batch
-          for (const resume of parsedBatch) {
+          // Parse the next batch while this one is being evaluated. At most two
+          // batches of text are held at once; the evaluation-time cache check
+          // still catches duplicates the parse-time check misses
+          if (i + BATCH_SIZE < files.length) {
+            pendingBatch = parseBatch(i + BATCH_SIZE);
+          }
+
+          // Evaluate the batch concurrently (capped by evaluationLimit); results
+          // stream to the client as they complete
+          await Promise.all(parsedBatch.map(async (resume) => {
           try {
-            const hash = createHash('sha256').update(resume.buffer).digest('hex');
-
-            // Check cache first
-            if (evaluationCache.has(hash)) {
-              const cachedResult = evaluationCache.get(hash);
-              if (cachedResult) {
-                // Ensure cached results also have resumeText
-                const resultWithResumeText = {
-                  ...cachedResult,
-                  resumeText: (cachedResult.resumeText as string) || resume.text,
-                  fromCache: true
-                };
-                controller.enqueue(createSseStream(resultWithResumeText, 'evaluation_result'));
-                completedCount++;
-                continue;
-              }
+            const hash = resume.hash;
+
+            // Cached results and duplicates already being evaluated in this
+            // request are both streamed as cache hits
+            const inFlight = inFlightEvaluations.get(hash);
+            const cachedResult = resume.cached || evaluationCache.get(hash) || (inFlight && await inFlight);
+            if (cachedResult) {
+              // Ensure cached results also have resumeText
+              const resultWithResumeText = {
+                ...cachedResult,
+                resumeText: cachedResult.resumeText || resume.text,
+                fromCache: true
+              };
+              controller.enqueue(createSseStream(resultWithResumeText, 'evaluation_result'));
+              completedCount++;
+              return;
             }
 
             if (resume.error || !resume.text) {
@@ -295,7 +274,7 @@ export async function POST(req: NextRequest) {
               }, 'evaluation_error'));
               errorCount++;
               completedCount++;
-              continue;
+              return;
             }
             
             // Check if preprocessing should be skipped
@@ -341,22 +320,33 @@ export async function POST(req: NextRequest) {
             
             // Use new rubric-based evaluation if enabled
             const useRubricScoring = process.env.USE_RUBRIC_SCORING === 'true' || true; // Default to new system
-            const result = useRubricScoring 
-              ? await evaluateCandidateV2(textToEvaluate, resume.fileName, jobRequirements)
-              : await evaluateCandidate(textToEvaluate, resume.fileName, jobRequirements);
+            const evaluation = evaluationLimit(() => useRubricScoring
+              ? evaluateCandidateV2(textToEvaluate, resume.fileName, jobRequirements)
+              : evaluateCandidate(textToEvaluate, resume.fileName, jobRequirements));
+
+            // Registered before the first await, so later duplicates in the batch
+            // find it; cleared once settled so a failure isn't reused
+            inFlightEvaluations.set(hash, evaluation);
+            let result: EvaluationResult;
+            try {
+              result = await evaluation;
+            } finally {
+              inFlightEvaluations.delete(hash);
+            }
             
             // Add resume text to the result for chat functionality
-            // Limit response size for Vercel (remove large resume text if over 1MB)
-            const MAX_RESUME_SIZE = 1024 * 1024; // 1MB
-            const resultWithResumeText = {
-              ...result,
-              resumeText: resume.text.length < MAX_RESUME_SIZE ? resume.text : '[Resume text too large to include]'
-            };
-            
+            // The evaluator builds a fresh result per call, so attaching the text in
+            // place is safe; the cache and the stream share this one object
+            result.resumeText = resume.text;
+
             // Store result in cache (with full text for internal use)
-            evaluationCache.set(hash, { ...result, resumeText: resume.text });
-            
-            // Send result to client (with size-limited text)
+            evaluationCache.set(hash, result);
+
+            // Send result to client, limiting response size for Vercel (remove large resume text if over 1MB)
+            const MAX_RESUME_SIZE = 1024 * 1024; // 1MB
+            const resultWithResumeText = resume.text.length < MAX_RESUME_SIZE
+              ? result
+              : { ...result, resumeText: '[Resume text too large to include]' };
             controller.enqueue(createSseStream(resultWithResumeText, 'evaluation_result'));
             
             completedCount++;
@@ -390,7 +380,7 @@ export async function POST(req: NextRequest) {
               percentage: percentage
             }, 'progress_update'));
           }
-          } // End of batch processing
+          })); // End of batch processing
           
           // Optional: Add a small delay between batches to prevent overload
           if (i + BATCH_SIZE < files.length) {
@@ -428,9 +418,15 @@ export async function POST(req: NextRequest) {
         controller.enqueue(createSseStream({ error: message }, 'error'));
         logger.apiError('POST', '/api/evaluate', error);
       } finally {
+        // A prefetched batch is left unawaited if the stream failed early
+        streamClosed = true;
+        pendingBatch.catch(() => {});
         controller.close();
       }
     },
+    cancel() {
+      streamClosed = true;
+    },
   });
 
   return new Response(stream, {
@@ -1,26 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server';
 import mammoth from 'mammoth';
-import { PdfReader } from 'pdfreader';
 import { getCorsHeaders } from '@/lib/corsHeaders';
 import { withSecurityHeaders } from '@/lib/securityHeaders';
 import { logger } from '@/lib/logger';
-
-async function parsePdf(buffer: Buffer): Promise<string> {
-  return new Promise((resolve, reject) => {
-    let content = "";
-    new PdfReader(null).parseBuffer(buffer, (err, item) => {
-      if (err) {
-        logger.error('Error parsing PDF (job description) with pdfreader:', err);
-        reject(new Error(`Failed to parse PDF (job description): ${err.message || 'Unknown PDF parsing error'}`));
-      } else if (!item) {
-        // End of buffer, PDF parsing is finished.
-        resolve(content.trim());
-      } else if (item.text) {
-        content += item.text + " "; // Add a space to separate text items
-      }
-    });
-  });
-}
+import { parsePdf } from '@/lib/pdfParser';
 
 async function getFileBuffer(file: File): Promise<Buffer> {
   const arrayBuffer = await file.arrayBuffer();
@@ -57,6 +40,14 @@ export async function POST(req: NextRequest) {
       });
     }
 
+    // A blank description would silently replace the user's input, so report it
+    if (!text.trim()) {
+      return NextResponse.json({ error: 'No text could be extracted from the file.' }, { 
+        status: 400,
+        headers: withSecurityHeaders(getCorsHeaders(origin))
+      });
+    }
+
     return NextResponse.json({ extractedText: text }, {
       headers: withSecurityHeaders(getCorsHeaders(origin))
     });
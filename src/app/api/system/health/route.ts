@@ -1,5 +1,7 @@
 import { NextResponse } from 'next/server';
 import OpenAI from 'openai';
+import { totalmem } from 'os';
+import { getOpenAIClient } from '@/lib/openaiClient';
 
 interface HealthCheckResult {
   status: 'healthy' | 'degraded' | 'unhealthy';
@@ -67,7 +69,7 @@ export async function GET() {
   try {
     // Get system info
     const memoryUsage = process.memoryUsage();
-    const totalMemory = (await import('os')).totalmem();
+    const totalMemory = totalmem();
     const usedMemory = memoryUsage.heapUsed + memoryUsage.external;
     
     const result: HealthCheckResult = {
@@ -92,7 +94,7 @@ export async function GET() {
     // Test Azure/OpenAI connectivity only if API key is configured
     if (process.env.OPENAI_API_KEY) {
       try {
-        const client = new OpenAI({ apiKey: process.env.OPENAI_API_KEY });
+        const client = getOpenAIClient();
       
       // Test different services
       const services = [
@@ -102,13 +104,16 @@ export async function GET() {
         { name: 'Requirement Extraction', prompt: 'Test extraction' }
       ];
 
-      for (const service of services) {
-        const testResult = await testService(client, service.name, service.prompt);
+      // Probes are independent, so run them concurrently (results keep list order)
+      const testResults = await Promise.all(
+        services.map(service => testService(client, service.name, service.prompt))
+      );
+      services.forEach((service, index) => {
         result.services.push({
           name: service.name,
-          ...testResult
+          ...testResults[index]
         });
-      }
+      });
 
       // Determine overall health
       const failedServices = result.services.filter(s => s.status === 'error').length;
@@ -197,11 +197,16 @@ export default function Home() {
         for (const line of lines) {
           if (!line.startsWith('data:') && !line.startsWith('event:')) continue;
 
-          const eventMatch = line.match(/^event: (.*)$/m);
-          const dataMatch = line.match(/^data: (.*)$/m);
-
-          const event = eventMatch ? eventMatch[1] : 'message';
-          const data = dataMatch ? JSON.parse(dataMatch[1]) : {};
+          // Frames are "event: <name>\ndata: <json>" with an optional event line.
+          // Both fields sit at fixed prefixes, so they are sliced out directly
+          let event = 'message';
+          let dataLine = line;
+          if (dataLine.startsWith('event: ')) {
+            const newline = dataLine.indexOf('\n');
+            event = newline === -1 ? dataLine.slice(7) : dataLine.slice(7, newline);
+            dataLine = newline === -1 ? '' : dataLine.slice(newline + 1);
+          }
+          const data = dataLine.startsWith('data: ') ? JSON.parse(dataLine.slice(6)) : {};
 
           switch (event) {
             case 'status_update':
@@ -261,20 +266,33 @@ export default function Home() {
     // Sort results by score (highest first) before export
     const sortedResults = [...evaluationResults].sort((a, b) => b.scores.overall - a.scores.overall);
 
-    const dataToExport = sortedResults.map(result => ({
-      'Candidate Name': result.candidateName,
-      'Overall Score (%)': result.scores.overall,
-      'Tier': result.tier,
-      'Quartile': result.quartileTier || 'N/A',
-      'Rank': result.quartileRank || 'N/A',
-      'Must-Haves Met': result.mustHavesMet ? 'Yes' : 'No',
-      'Strengths': result.strengths.join('; '),
-      'Weaknesses': result.gaps.join('; '),
-      'Professionalism Score (%)': result.scores.professionalism,
-      'AI Justification': result.explanation,
-    }));
-
-    const csv = Papa.unparse(dataToExport);
+    // Each row is an array in header order, and Papa writes the fields positionally
+    const fields = [
+      'Candidate Name',
+      'Overall Score (%)',
+      'Tier',
+      'Quartile',
+      'Rank',
+      'Must-Haves Met',
+      'Strengths',
+      'Weaknesses',
+      'Professionalism Score (%)',
+      'AI Justification',
+    ];
+    const data = sortedResults.map(result => [
+      result.candidateName,
+      result.scores.overall,
+      result.tier,
+      result.quartileTier || 'N/A',
+      result.quartileRank || 'N/A',
+      result.mustHavesMet ? 'Yes' : 'No',
+      result.strengths.join('; '),
+      result.gaps.join('; '),
+      result.scores.professionalism,
+      result.explanation,
+    ]);
+
+    const csv = Papa.unparse({ fields, data });
     const blob = new Blob([csv], { type: 'text/csv;charset=utf-8;' });
     const link = document.createElement('a');
     const url = URL.createObjectURL(blob);
@@ -327,15 +345,16 @@ export default function Home() {
       'Not Qualified': []
     };
     
+    // Map old quartile names to new ones for backward compatibility
+    const groupMapping: Record<string, string> = {
+      'Q1 - Top 25%': 'Q1 - Best Candidates (Top 25%)',
+      'Q2 - Top 50%': 'Q2 - Strong Candidates (26-50%)',
+      'Q3 - Top 75%': 'Q3 - Fair Candidates (51-75%)',
+      'Q4 - Bottom 25%': 'Q4 - Weak Fit (Bottom 25%)'
+    };
+
     sortedResults.forEach(result => {
       const group = result.quartileTier || 'Not Qualified';
-      // Map old quartile names to new ones for backward compatibility
-      const groupMapping: Record<string, string> = {
-        'Q1 - Top 25%': 'Q1 - Best Candidates (Top 25%)',
-        'Q2 - Top 50%': 'Q2 - Strong Candidates (26-50%)',
-        'Q3 - Top 75%': 'Q3 - Fair Candidates (51-75%)',
-        'Q4 - Bottom 25%': 'Q4 - Weak Fit (Bottom 25%)'
-      };
       const mappedGroup = groupMapping[group] || group;
       
       if (quartileGroups[mappedGroup]) {
@@ -364,7 +383,7 @@ export default function Home() {
       doc.text(quartile, 14, yPos);
       yPos += 10;
       
-      candidates.forEach((result) => {
+      candidates.forEach((result, index) => {
         globalIndex++;
       if (yPos > pageHeight - 60) { // Margin for footer
         doc.addPage();
@@ -416,7 +435,7 @@ export default function Home() {
       yPos += (explanation.length * 5) + 15;
 
       // Add separator line between candidates within same quartile
-      if (candidates.indexOf(result) < candidates.length - 1) {
+      if (index < candidates.length - 1) {
         doc.setDrawColor(221, 221, 221);
         doc.line(14, yPos - 8, pageWidth - 14, yPos - 8);
       }
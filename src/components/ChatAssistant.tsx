@@ -95,7 +95,8 @@ const ChatAssistant: React.FC<ChatAssistantProps> = ({
           query: queryText,
           candidateId: selectedCandidate?.candidateName,
           resumeText: selectedCandidate?.resumeText, // Assume this exists or will be added
-          evaluationResult: selectedCandidate,
+          // resumeText is already sent above; don't serialize the resume twice
+          evaluationResult: selectedCandidate && { ...selectedCandidate, resumeText: undefined },
           jobDescription: jobDescription || jobInfo?.jobRequirements?.description,
           mustHaveAttributes: mustHaveAttributes || jobInfo?.jobRequirements?.mustHave?.join(', '),
         }),
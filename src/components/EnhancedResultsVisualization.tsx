@@ -2,6 +2,7 @@
 
 import React from 'react';
 import { EvaluationResult } from '@/types';
+import { topK } from '@/lib/topK';
 import { 
   BarChart,
   Bar,
@@ -64,10 +65,7 @@ export default function EnhancedResultsVisualization({
   const qualificationRate = (qualifiedCount / totalCount) * 100;
 
   const averageScore = results.reduce((sum, r) => sum + r.scores.overall, 0) / results.length;
-  const topPerformers = results
-    .filter(r => r.mustHavesMet)
-    .sort((a, b) => b.scores.overall - a.scores.overall)
-    .slice(0, 3);
+  const topPerformers = topK(results.filter(r => r.mustHavesMet), 3, r => r.scores.overall);
 
   function getTierColor(tier: string): string {
     const colors = {
@@ -129,6 +129,7 @@ const FloatingChatWidget: React.FC<FloatingChatWidgetProps> = ({
         resumeText: selectedCandidate?.resumeText,
         evaluationResult: {
           ...selectedCandidate,
+          resumeText: undefined, // Already sent above; don't serialize the resume twice
           quartileTier: selectedCandidate?.quartileTier,
           quartileRank: selectedCandidate?.quartileRank,
           totalQualifiedForQuartile: selectedCandidate?.totalQualifiedForQuartile,
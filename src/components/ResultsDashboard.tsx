@@ -31,6 +31,10 @@ const ExpandedRowContent: React.FC<{ result: EvaluationResult, jobRequirements:
   const mustHaves = jobRequirements.mustHave || [];
   const niceToHaves = jobRequirements.niceToHave || [];
 
+  // Lowercased copies of gaps and strengths, shared by every requirement check below
+  const gapsLower = useMemo(() => result.gaps.map(gap => gap.toLowerCase()), [result.gaps]);
+  const strengthsLower = useMemo(() => result.strengths.map(strength => strength.toLowerCase()), [result.strengths]);
+
   return (
     <div className="p-4 bg-gray-50 border-l-4 border-rush-blue-light">
       <h4 className="text-md font-semibold text-rush-blue-dark mb-2">Detailed Breakdown:</h4>
@@ -41,14 +45,17 @@ const ExpandedRowContent: React.FC<{ result: EvaluationResult, jobRequirements:
           <p className="font-medium text-gray-700">Must-Have Requirements:</p>
           <ul className="list-disc list-inside ml-4 text-sm">
             {mustHaves.map((req, idx) => {
-              const isMet = result.mustHavesMet || !result.gaps.some(gap => gap.toLowerCase().includes(req.toLowerCase()));
+              const reqLower = req.toLowerCase();
+              const gapIndex = gapsLower.findIndex(gap => gap.includes(reqLower));
+              const matchingGap = gapIndex === -1 ? undefined : result.gaps[gapIndex];
+              const isMet = result.mustHavesMet || matchingGap === undefined;
               // A more robust check would involve specific flags from the backend if a must-have is unmet.
               // For now, we infer based on mustHavesMet flag and if the gap mentions the requirement.
               return (
                 <li key={`must-${idx}`} className={isMet ? 'text-green-600' : 'text-red-600'}>
                   {req}: <span className="font-semibold">{isMet ? 'Met' : 'Not Met'}</span>
-                  {!isMet && result.gaps.find(gap => gap.toLowerCase().includes(req.toLowerCase())) && 
-                    <span className="italic"> - {result.gaps.find(gap => gap.toLowerCase().includes(req.toLowerCase()))}</span>}
+                  {!isMet && matchingGap && 
+                    <span className="italic"> - {matchingGap}</span>}
                 </li>
               );
             })}
@@ -62,8 +69,9 @@ const ExpandedRowContent: React.FC<{ result: EvaluationResult, jobRequirements:
           <p className="font-medium text-gray-700">Nice-to-Have Requirements:</p>
           <ul className="list-disc list-inside ml-4 text-sm">
             {niceToHaves.map((req, idx) => {
-              const isStrength = result.strengths.some(strength => strength.toLowerCase().includes(req.toLowerCase()));
-              const isGap = result.gaps.some(gap => gap.toLowerCase().includes(req.toLowerCase()));
+              const reqLower = req.toLowerCase();
+              const isStrength = strengthsLower.some(strength => strength.includes(reqLower));
+              const isGap = gapsLower.some(gap => gap.includes(reqLower));
               let status = 'Neutral';
               let statusClass = 'text-gray-600';
               if (isStrength) { status = 'Aligned'; statusClass = 'text-green-600'; }
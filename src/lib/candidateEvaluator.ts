@@ -1,25 +1,11 @@
-import OpenAI from 'openai';
 import {
   EnhancedJobRequirements,
   EvaluationResult,
 } from '@/types';
 import { retryOpenAICall } from './retryUtils';
+import { getOpenAIClient } from './openaiClient';
 import { logger } from './logger';
 
-let openai: OpenAI | null = null;
-
-function getOpenAIClient(): OpenAI {
-  if (!process.env.OPENAI_API_KEY) {
-    throw new Error('OPENAI_API_KEY is not set or empty in the environment.');
-  }
-  if (!openai) {
-    openai = new OpenAI({
-      apiKey: process.env.OPENAI_API_KEY,
-    });
-  }
-  return openai;
-}
-
 // Dynamically generate transferable skills based on job requirements
 function generateTransferableSkillsMapping(jobRequirements?: EnhancedJobRequirements): string {
   if (!jobRequirements) {
@@ -368,7 +354,7 @@ export async function evaluateCandidate(
   try {
     // Build the user content message
     const userContentParts = [
-      `Please evaluate the following resume:\n\n**Resume File Name:** ${fileName}\n\n**Resume Text:**\n${resumeText}\n\n**Job Requirements:**\n${JSON.stringify(jobRequirements, null, 2)}\n\n**CRITICAL TRANSFERABLE SKILLS INSTRUCTION:**`,
+      `Please evaluate the following resume:\n\n**Resume File Name:** ${fileName}\n\n**Resume Text:**\n${resumeText}\n\n**Job Requirements:**\n${JSON.stringify(jobRequirements)}\n\n**CRITICAL TRANSFERABLE SKILLS INSTRUCTION:**`,
       'BE INCLUSIVE AND CREATIVE in recognizing how the candidate\'s experience transfers to this role. For example:',
       '- House cleaning experience IS relevant for hospital environmental technician roles',
       '- Retail experience IS relevant for patient interaction roles',
@@ -1,4 +1,3 @@
-import OpenAI from 'openai';
 import {
   EnhancedJobRequirements,
   EvaluationResult,
@@ -6,23 +5,10 @@ import {
   ScoreBreakdown,
 } from '@/types';
 import { retryOpenAICall } from './retryUtils';
+import { getOpenAIClient } from './openaiClient';
 import { calculateScores, determineTier } from './scoreCalculator';
 import { logger } from './logger';
 
-let openai: OpenAI | null = null;
-
-function getOpenAIClient(): OpenAI {
-  if (!process.env.OPENAI_API_KEY) {
-    throw new Error('OPENAI_API_KEY is not set or empty in the environment.');
-  }
-  if (!openai) {
-    openai = new OpenAI({
-      apiKey: process.env.OPENAI_API_KEY,
-    });
-  }
-  return openai;
-}
-
 // Generate the rubric extraction prompt
 // Generate job-specific transferable skills based on job requirements
 const generateJobSpecificTransferableSkills = (jobRequirements: EnhancedJobRequirements): string => {
@@ -246,9 +232,25 @@ const generateRubricExtractionPrompt = (jobType: string, jobRequirements: Enhanc
   return basePrompt;
 };
 
-// Generate the output format specification
-const generateOutputFormat = (): string => {
-  return `
+// The system prompt and requirements JSON depend only on the job, which is identical
+// for every resume in a batch, so they are cached per job object.
+// Compact JSON: the model reads it fine and indentation only adds prompt tokens per resume
+const jobPromptCache = new WeakMap<EnhancedJobRequirements, { systemPrompt: string; requirementsJson: string }>();
+
+const getJobPrompt = (jobRequirements: EnhancedJobRequirements) => {
+  let jobPrompt = jobPromptCache.get(jobRequirements);
+  if (jobPrompt === undefined) {
+    jobPrompt = {
+      systemPrompt: generateRubricExtractionPrompt(jobRequirements.jobType, jobRequirements),
+      requirementsJson: JSON.stringify(jobRequirements)
+    };
+    jobPromptCache.set(jobRequirements, jobPrompt);
+  }
+  return jobPrompt;
+};
+
+// Output format specification (static, so built once at module load)
+const OUTPUT_FORMAT = `
 {
   "candidateId": "filename",
   "candidateName": "extracted full name",
@@ -299,7 +301,6 @@ const generateOutputFormat = (): string => {
   "hiringRecommendation": "Strongly recommend|Recommend|Consider|Pass",
   "recommendationRationale": "Brief explanation of recommendation based on evidence"
 }`;
-};
 
 /**
  * Evaluates a candidate using rubric-based scoring
@@ -310,7 +311,7 @@ export async function evaluateCandidateV2(
   jobRequirements: EnhancedJobRequirements
 ): Promise<EvaluationResult> {
   const client = getOpenAIClient();
-  const systemPrompt = generateRubricExtractionPrompt(jobRequirements.jobType, jobRequirements);
+  const { systemPrompt, requirementsJson } = getJobPrompt(jobRequirements);
   
   logger.debug('📊 Resume Evaluation V2 using: Rubric-based scoring', {
     jobType: jobRequirements.jobType,
@@ -327,10 +328,10 @@ export async function evaluateCandidateV2(
       resumeText,
       ``,
       `**Job Requirements:**`,
-      JSON.stringify(jobRequirements, null, 2),
+      requirementsJson,
       ``,
       `**Required Output Format:**`,
-      generateOutputFormat()
+      OUTPUT_FORMAT
     ].join('\n');
 
     const response = await retryOpenAICall(
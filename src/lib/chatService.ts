@@ -1,21 +1,9 @@
 // src/lib/chatService.ts
-import OpenAI from 'openai';
 import { ChatIntent, IntentClassificationResult, EvidenceSource, ChatContext } from '@/types/chat';
 import { logger } from './logger';
-
-// Ensure OpenAI client is properly initialized
-let openai: OpenAI | null = null;
-
-function getOpenAIClient(): OpenAI {
-  if (!openai) {
-    const apiKey = process.env.OPENAI_API_KEY;
-    if (!apiKey) {
-      throw new Error('OPENAI_API_KEY environment variable is not set');
-    }
-    openai = new OpenAI({ apiKey });
-  }
-  return openai;
-}
+import { getOpenAIClient } from './openaiClient';
+import { LRUCache } from './lruCache';
+import { topK } from './topK';
 
 export class ChatService {
   private static readonly RISEN_SYSTEM_PROMPT = `
@@ -89,54 +77,63 @@ EXPECTATIONS:
 - Help users understand why candidates received specific scores
 `;
 
-  static async classifyIntent(query: string): Promise<IntentClassificationResult> {
-    const intentPatterns: Record<ChatIntent, RegExp[]> = {
-      resume_detail_inquiry: [
-        /did they mention|do they have|where.*show|what.*experience/i,
-        /background in|skilled in|familiar with/i
-      ],
-      evaluation_challenge: [
-        /why.*qualified|why.*score|why.*ranked|what.*wrong/i,
-        /reason.*failed|explanation.*tier/i
-      ],
-      candidate_comparison: [
-        /stronger than|better than|compare.*to|versus|vs\./i,
-        /who.*better|which.*candidate/i
-      ],
-      skill_verification: [
-        /where.*leadership|demonstrate.*skills|show.*ability/i,
-        /evidence.*of|proof.*of/i
-      ],
-      experience_analysis: [
-        /years.*experience|how long|duration.*work/i,
-        /career.*length|time.*in/i
-      ],
-      ambiguity_check: [
-        /justified|reasonable|fair.*assessment|accurate/i,
-        /should.*be.*higher|seems.*low/i
-      ],
-      ranking_explanation: [
-        /what.*(?:Q1|Q2|Q3|Q4|quartile)|quartile.*mean|how.*ranked/i,
-        /explain.*ranking|ranking.*system|what.*top.*25/i,
-        /bottom.*25|how.*calculate.*quartile/i
-      ],
-      scoring_rationale: [
-        /why.*score.*\d+|explain.*score|scoring.*methodology/i,
-        /how.*scored|scoring.*criteria|why.*\d+.*percent/i,
-        /score.*rationale|scoring.*range/i
-      ],
-      unknown: []
-    };
+  // Intent patterns are compiled once; none use the g flag, so test() is stateless
+  private static readonly INTENT_PATTERNS: Record<ChatIntent, RegExp[]> = {
+    resume_detail_inquiry: [
+      /did they mention|do they have|where.*show|what.*experience/i,
+      /background in|skilled in|familiar with/i
+    ],
+    evaluation_challenge: [
+      /why.*qualified|why.*score|why.*ranked|what.*wrong/i,
+      /reason.*failed|explanation.*tier/i
+    ],
+    candidate_comparison: [
+      /stronger than|better than|compare.*to|versus|vs\./i,
+      /who.*better|which.*candidate/i
+    ],
+    skill_verification: [
+      /where.*leadership|demonstrate.*skills|show.*ability/i,
+      /evidence.*of|proof.*of/i
+    ],
+    experience_analysis: [
+      /years.*experience|how long|duration.*work/i,
+      /career.*length|time.*in/i
+    ],
+    ambiguity_check: [
+      /justified|reasonable|fair.*assessment|accurate/i,
+      /should.*be.*higher|seems.*low/i
+    ],
+    ranking_explanation: [
+      /what.*(?:Q1|Q2|Q3|Q4|quartile)|quartile.*mean|how.*ranked/i,
+      /explain.*ranking|ranking.*system|what.*top.*25/i,
+      /bottom.*25|how.*calculate.*quartile/i
+    ],
+    scoring_rationale: [
+      /why.*score.*\d+|explain.*score|scoring.*methodology/i,
+      /how.*scored|scoring.*criteria|why.*\d+.*percent/i,
+      /score.*rationale|scoring.*range/i
+    ],
+    unknown: []
+  };
 
-    for (const [intent, patterns] of Object.entries(intentPatterns)) {
-      for (const pattern of patterns) {
-        if (pattern.test(query)) {
-          return {
-            intent: intent as ChatIntent,
-            confidence: 0.8,
-            entities: this.extractEntities(query)
-          };
-        }
+  // Each intent's patterns joined into a single alternation, so a query is tested
+  // against one regex per intent. Intents without patterns are skipped, since an
+  // empty alternation would match everything
+  private static readonly INTENT_MATCHERS: [ChatIntent, RegExp][] = Object.entries(ChatService.INTENT_PATTERNS)
+    .filter(([, patterns]) => patterns.length > 0)
+    .map(([intent, patterns]) => [
+      intent as ChatIntent,
+      new RegExp(patterns.map(pattern => `(?:${pattern.source})`).join('|'), 'i')
+    ]);
+
+  static async classifyIntent(query: string): Promise<IntentClassificationResult> {
+    for (const [intent, matcher] of ChatService.INTENT_MATCHERS) {
+      if (matcher.test(query)) {
+        return {
+          intent,
+          confidence: 0.8,
+          entities: this.extractEntities(query)
+        };
       }
     }
 
@@ -166,18 +163,35 @@ EXPECTATIONS:
     return entities;
   }
 
+  // Sentence index per resume (split, trimmed and lowercased once), reused across
+  // the follow-up questions a recruiter asks about the same candidate.
+  // Max 20 resumes, 30 minutes TTL
+  private static readonly sentenceIndexCache = new LRUCache<string, { sentences: string[]; sentencesLower: string[] }>(20, 30);
+
+  private static getSentenceIndex(resumeText: string): { sentences: string[]; sentencesLower: string[] } {
+    let index = this.sentenceIndexCache.get(resumeText);
+    if (!index) {
+      const sentences = resumeText.split(/[.!?]+/)
+        .map(s => s.trim())
+        .filter(s => s.length > 0);
+      index = { sentences, sentencesLower: sentences.map(s => s.toLowerCase()) };
+      this.sentenceIndexCache.set(resumeText, index);
+    }
+    return index;
+  }
+
   static async searchResume(resumeText: string, query: string): Promise<EvidenceSource[]> {
     if (!resumeText) return [];
 
     const evidence: EvidenceSource[] = [];
-    const sentences = resumeText.split(/[.!?]+/).filter(s => s.trim().length > 0);
+    const { sentences, sentencesLower } = this.getSentenceIndex(resumeText);
     
     // Simple semantic search - in production, use embeddings
     const queryTerms = query.toLowerCase().split(/\s+/);
     
     for (let i = 0; i < sentences.length; i++) {
-      const sentence = sentences[i].trim();
-      const sentenceLower = sentence.toLowerCase();
+      const sentence = sentences[i];
+      const sentenceLower = sentencesLower[i];
       
       let relevanceScore = 0;
       for (const term of queryTerms) {
@@ -196,9 +210,7 @@ EXPECTATIONS:
       }
     }
 
-    return evidence
-      .sort((a, b) => b.relevanceScore - a.relevanceScore)
-      .slice(0, 5); // Top 5 most relevant
+    return topK(evidence, 5, e => e.relevanceScore); // Top 5 most relevant
   }
 
   static async generateResponse(
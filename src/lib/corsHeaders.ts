@@ -1,9 +1,10 @@
+// Parsed once at module load; ALLOWED_ORIGINS doesn't change while the server runs
+const allowedOrigins = process.env.ALLOWED_ORIGINS?.split(',').map(o => o.trim()).filter(Boolean) || [];
+
 /**
  * Get CORS headers based on environment configuration
  */
 export function getCorsHeaders(origin?: string | null): HeadersInit {
-  const allowedOrigins = process.env.ALLOWED_ORIGINS?.split(',').map(o => o.trim()).filter(Boolean) || [];
-  
   // Default to restrictive CORS in production
   let allowOrigin = '';
   
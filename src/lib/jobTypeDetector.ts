@@ -1,20 +1,6 @@
-import OpenAI from 'openai';
 import { JobType } from '@/types';
 import { retryOpenAICall } from './retryUtils';
-
-let openai: OpenAI | null = null;
-
-function getOpenAIClient(): OpenAI {
-  if (!process.env.OPENAI_API_KEY) {
-    throw new Error('OPENAI_API_KEY is not set or empty in the environment.');
-  }
-  if (!openai) {
-    openai = new OpenAI({
-      apiKey: process.env.OPENAI_API_KEY,
-    });
-  }
-  return openai;
-}
+import { getOpenAIClient } from './openaiClient';
 
 const systemPrompt = `Analyze this job description and classify it into the most appropriate category based on experience level and skill requirements:
 
@@ -9,9 +9,22 @@ interface LogContext {
 
 class Logger {
   private isDevelopment = process.env.NODE_ENV === 'development';
+  private lastTimestampMs = 0;
+  private lastTimestamp = '';
+
+  // Reuse the formatted timestamp while the millisecond clock hasn't advanced;
+  // batch processing emits bursts of log lines within the same millisecond
+  private getTimestamp(): string {
+    const now = Date.now();
+    if (now !== this.lastTimestampMs) {
+      this.lastTimestampMs = now;
+      this.lastTimestamp = new Date(now).toISOString();
+    }
+    return this.lastTimestamp;
+  }
   
   private formatMessage(level: LogLevel, message: string, context?: LogContext): string {
-    const timestamp = new Date().toISOString();
+    const timestamp = this.getTimestamp();
     const contextStr = context ? ` ${JSON.stringify(context)}` : '';
     return `[${timestamp}] [${level.toUpperCase()}] ${message}${contextStr}`;
   }
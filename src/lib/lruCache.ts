@@ -82,14 +82,10 @@ export class LRUCache<K, V> {
 
   private cleanExpired(): void {
     const now = Date.now();
-    const keysToDelete: K[] = [];
-    
     this.cache.forEach((item, key) => {
       if (now - item.timestamp > this.ttl) {
-        keysToDelete.push(key);
+        this.cache.delete(key);
       }
     });
-    
-    keysToDelete.forEach(key => this.cache.delete(key));
   }
 }
\ No newline at end of file
@@ -0,0 +1,18 @@
+import OpenAI from 'openai';
+
+let openai: OpenAI | null = null;
+
+/**
+ * Returns the shared OpenAI client, creating it on first use.
+ * @throws An error if OPENAI_API_KEY is not configured.
+ */
+export function getOpenAIClient(): OpenAI {
+  if (!openai) {
+    const apiKey = process.env.OPENAI_API_KEY;
+    if (!apiKey) {
+      throw new Error('OPENAI_API_KEY is not set or empty in the environment.');
+    }
+    openai = new OpenAI({ apiKey });
+  }
+  return openai;
+}
@@ -0,0 +1,91 @@
+import { PdfReader } from 'pdfreader';
+import { logger } from './logger';
+
+/**
+ * Extracts the text content of a PDF, shared by the resume and job description routes.
+ * @param buffer The raw PDF file contents.
+ * @param options.allowPartial Resolve with the text read so far if parsing stalls or
+ *   fails after enough text was read, instead of rejecting. Off by default.
+ * @returns The extracted text, with page breaks as blank lines.
+ * @throws An error if the PDF can't be parsed or times out (unless partial content is allowed).
+ */
+export async function parsePdf(
+  buffer: Buffer,
+  { allowPartial = false }: { allowPartial?: boolean } = {}
+): Promise<string> {
+  return new Promise((resolve, reject) => {
+    let content = "";
+    let itemCount = 0;
+    let pageCount = 0;
+    const startTime = Date.now();
+    
+    // Safety timeout for PDF parsing (9 seconds for Vercel compatibility)
+    const timeout = setTimeout(() => {
+      logger.warn('PDF parsing taking too long', {
+        itemCount,
+        pageCount,
+        contentLength: content.length,
+        allowPartial
+      });
+      if (allowPartial) {
+        resolve(content.trim());
+      } else {
+        reject(new Error('PDF parsing timeout'));
+      }
+    }, 9000);
+    
+    try {
+      new PdfReader(null).parseBuffer(buffer, (err, item) => {
+        if (err) {
+          clearTimeout(timeout);
+          logger.error('PDF parsing failed', err, { 
+            fileType: 'pdf',
+            bufferSize: buffer.length,
+            itemsProcessed: itemCount,
+            pagesProcessed: pageCount
+          });
+          
+          // Return partial content if available
+          const partialContent = content.trim();
+          if (allowPartial && partialContent.length > 100) {
+            logger.info('Returning partial PDF content after error', {
+              contentLength: partialContent.length
+            });
+            resolve(partialContent);
+          } else {
+            reject(new Error(`PDF parsing error: ${err.message || 'Unknown error'}`));
+          }
+        } else if (!item) {
+          // End of buffer, PDF parsing is finished.
+          clearTimeout(timeout);
+          const duration = Date.now() - startTime;
+          const finalContent = content.trim();
+          
+          logger.info('PDF parsing completed', { 
+            itemCount, 
+            pageCount,
+            contentLength: finalContent.length,
+            duration,
+            averageItemsPerPage: pageCount > 0 ? Math.round(itemCount / pageCount) : 0
+          });
+          
+          resolve(finalContent);
+        } else if (item.text) {
+          itemCount++;
+          const text = item.text.trim();
+          if (text) {
+            content += text + " ";
+          }
+        } else if (item.page) {
+          pageCount = item.page;
+          // Add page break for better text structure
+          content += "\n\n";
+        }
+      });
+    } catch (parseError) {
+      clearTimeout(timeout);
+      logger.error('PDF parser threw exception', parseError);
+      reject(new Error('PDF parser exception'));
+    }
+  });
+}
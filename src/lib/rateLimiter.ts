@@ -54,12 +54,11 @@ class RateLimiter {
   // Clean up expired entries periodically
   cleanup(): void {
     const now = Date.now();
-    const entries = Array.from(this.requests.entries());
-    for (const [key, entry] of entries) {
+    this.requests.forEach((entry, key) => {
       if (now > entry.resetTime) {
         this.requests.delete(key);
       }
-    }
+    });
   }
 }
 
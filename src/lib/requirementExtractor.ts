@@ -1,21 +1,7 @@
-import OpenAI from 'openai';
 import { EnhancedJobRequirements, JobType } from '@/types';
 import { jobTypeProfiles } from './jobTypeProfiles';
 import { retryOpenAICall } from './retryUtils';
-
-let openai: OpenAI | null = null;
-
-function getOpenAIClient(): OpenAI {
-  if (!process.env.OPENAI_API_KEY) {
-    throw new Error('OPENAI_API_KEY is not set or empty in the environment.');
-  }
-  if (!openai) {
-    openai = new OpenAI({
-      apiKey: process.env.OPENAI_API_KEY,
-    });
-  }
-  return openai;
-}
+import { getOpenAIClient } from './openaiClient';
 
 /**
  * Extracts structured job requirements from a job description using a profile-based prompt.
@@ -1,5 +1,33 @@
 import { logger } from './logger';
 
+// Common boilerplate phrases, removed in this order. Order matters: the
+// ".+" patterns must only see what the earlier removals left behind
+const BOILERPLATE_PATTERNS = [
+  /References available upon request/gi,
+  /An equal opportunity employer/gi,
+  /Page \d+ of \d+/gi,
+  /Printed on .+/gi,
+  /Generated by .+/gi,
+  /Resume - \d+ pages?/gi,
+];
+
+// Common variations to normalize, and their canonical forms
+const NORMALIZATIONS: [RegExp, string][] = [
+  [/e-mail|e mail/, 'email'],
+  [/Ph\.D\.|PhD|Ph\.D/, 'PhD'],
+  [/B\.S\.|BS|B\.Sc\./, 'BS'],
+  [/M\.S\.|MS|M\.Sc\./, 'MS'],
+  [/Sr\.|Senior/, 'Senior'],
+  [/Jr\.|Junior/, 'Junior'],
+];
+
+// All variations in a single alternation with one capture group per entry;
+// whichever group matched selects the canonical form
+const NORMALIZATION_PATTERN = new RegExp(
+  `\\b(?:${NORMALIZATIONS.map(([pattern]) => `(${pattern.source})`).join('|')})\\b`,
+  'gi'
+);
+
 // Resume preprocessing to optimize token usage
 export function preprocessResume(resumeText: string): string {
   // Preserve original formatting better
@@ -10,27 +38,15 @@ export function preprocessResume(resumeText: string): string {
     .trim();
   
   // Remove common boilerplate phrases
-  const boilerplatePatterns = [
-    /References available upon request/gi,
-    /An equal opportunity employer/gi,
-    /Page \d+ of \d+/gi,
-    /Printed on .+/gi,
-    /Generated by .+/gi,
-    /Resume - \d+ pages?/gi,
-  ];
-  
-  boilerplatePatterns.forEach(pattern => {
+  BOILERPLATE_PATTERNS.forEach(pattern => {
     processed = processed.replace(pattern, '');
   });
   
   // Normalize common variations
-  processed = processed
-    .replace(/\b(e-mail|e mail)\b/gi, 'email')
-    .replace(/\b(Ph\.D\.|PhD|Ph\.D)\b/gi, 'PhD')
-    .replace(/\b(B\.S\.|BS|B\.Sc\.)\b/gi, 'BS')
-    .replace(/\b(M\.S\.|MS|M\.Sc\.)\b/gi, 'MS')
-    .replace(/\b(Sr\.|Senior)\b/gi, 'Senior')
-    .replace(/\b(Jr\.|Junior)\b/gi, 'Junior');
+  processed = processed.replace(NORMALIZATION_PATTERN, (match: string, ...groups: unknown[]) => {
+    const index = groups.findIndex(group => group !== undefined);
+    return index >= 0 && index < NORMALIZATIONS.length ? NORMALIZATIONS[index][1] : match;
+  });
   
   // Extract and structure key sections
   const sections = extractSections(processed);
@@ -49,19 +65,28 @@ interface ResumeSections {
   other?: string;
 }
 
+// Common section headers - very flexible matching, compiled once at module load
+const SECTION_PATTERNS = Object.entries({
+  contact: /^\s*(contact|personal\s+information|info|name|phone|email|address)\s*[:.-]?\s*$/im,
+  summary: /^\s*(summary|objective|profile|professional\s+summary|career\s+objective|about\s+me|overview)\s*[:.-]?\s*$/im,
+  experience: /^\s*(experience|work\s+experience|professional\s+experience|employment|work\s+history|career\s+history|employment\s+history|positions\s+held|work\s+background)\s*[:.-]?\s*$/im,
+  education: /^\s*(education|academic|qualifications|degrees|schooling|training|academic\s+background)\s*[:.-]?\s*$/im,
+  skills: /^\s*(skills|technical\s+skills|core\s+competencies|expertise|technologies|proficiencies|competencies|abilities)\s*[:.-]?\s*$/im,
+  certifications: /^\s*(certifications?|licenses?|credentials?|certificates?|professional\s+development)\s*[:.-]?\s*$/im,
+});
+
+function matchSectionHeader(line: string): string | undefined {
+  for (const [section, pattern] of SECTION_PATTERNS) {
+    if (pattern.test(line)) {
+      return section;
+    }
+  }
+  return undefined;
+}
+
 function extractSections(text: string): ResumeSections {
   const sections: ResumeSections = {};
   
-  // Common section headers - very flexible matching
-  const sectionPatterns: { [key: string]: RegExp } = {
-    contact: /^\s*(contact|personal\s+information|info|name|phone|email|address)\s*[:.-]?\s*$/im,
-    summary: /^\s*(summary|objective|profile|professional\s+summary|career\s+objective|about\s+me|overview)\s*[:.-]?\s*$/im,
-    experience: /^\s*(experience|work\s+experience|professional\s+experience|employment|work\s+history|career\s+history|employment\s+history|positions\s+held|work\s+background)\s*[:.-]?\s*$/im,
-    education: /^\s*(education|academic|qualifications|degrees|schooling|training|academic\s+background)\s*[:.-]?\s*$/im,
-    skills: /^\s*(skills|technical\s+skills|core\s+competencies|expertise|technologies|proficiencies|competencies|abilities)\s*[:.-]?\s*$/im,
-    certifications: /^\s*(certifications?|licenses?|credentials?|certificates?|professional\s+development)\s*[:.-]?\s*$/im,
-  };
-  
   // Split text into lines for processing
   const lines = text.split(/\n/);
   let currentSection = 'other';
@@ -76,28 +101,21 @@ function extractSections(text: string): ResumeSections {
   lines.forEach(line => {
     const trimmedLine = line.trim();
     
-    // Check if this line is a section header
-    let foundSection = false;
-    
-    // Also check for all-caps versions and with/without colons
-    const lineVariations = [
-      trimmedLine,
-      trimmedLine.toUpperCase(),
-      trimmedLine.replace(/[:.-]\s*$/, ''),  // Remove trailing punctuation
-    ];
+    // Check if this line is a section header, then its all-caps version, then
+    // the line without trailing punctuation. The patterns are case-insensitive,
+    // so the all-caps retry can only matter for non-ASCII letters (e.g. 'ı', 'ſ'),
+    // and the stripped retry only when stripping changes the line
+    const strippedLine = trimmedLine.replace(/[:.-]\s*$/, '');
+    const section = matchSectionHeader(trimmedLine) ??
+      (/[\u0080-\uFFFF]/.test(trimmedLine) ? matchSectionHeader(trimmedLine.toUpperCase()) : undefined) ??
+      (strippedLine !== trimmedLine ? matchSectionHeader(strippedLine) : undefined);
+    const foundSection = section !== undefined;
     
-    for (const lineVar of lineVariations) {
-      for (const [section, pattern] of Object.entries(sectionPatterns)) {
-        if (pattern.test(lineVar)) {
-          currentSection = section;
-          if (!sectionContent[section]) {
-            sectionContent[section] = [];
-          }
-          foundSection = true;
-          break;
-        }
+    if (section) {
+      currentSection = section;
+      if (!sectionContent[section]) {
+        sectionContent[section] = [];
       }
-      if (foundSection) break;
     }
     
     // Add content to current section if not a header
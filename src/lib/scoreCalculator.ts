@@ -427,6 +427,29 @@ function extractYearsFromRequirements(mustHaves: string[]): number {
   return 0; // No specific years requirement found
 }
 
+/**
+ * Lowercase the evidence lists up front so the per-requirement
+ * checks below don't re-lowercase the same strings for every requirement
+ */
+function lowercaseEvidence(evaluation: RubricEvaluation) {
+  const lower = (items: string[]) => items.map(item => item.toLowerCase());
+  return {
+    requiredTechs: lower(evaluation.technicalSkills.requiredTechsFound),
+    similarTechs: lower(evaluation.technicalSkills.similarTechsFound),
+    certifications: lower(evaluation.education.certifications),
+    transferableSkills: lower(evaluation.bonusFactors.transferableSkills),
+    culturalFitIndicators: lower(evaluation.softSkills.culturalFitIndicators),
+    achievements: lower(evaluation.experience.quantifiableAchievements)
+  };
+}
+
+/**
+ * Check whether a lowercased requirement and any lowercased term contain one another
+ */
+function overlapsAny(reqLower: string, terms: string[]): boolean {
+  return terms.some(term => reqLower.includes(term) || term.includes(reqLower));
+}
+
 /**
  * Count how many required qualifications are exactly met
  */
@@ -437,6 +460,7 @@ function countExactRequiredMatches(evaluation: RubricEvaluation, jobRequirements
 
   let exactMatches = 0;
   const jobType = jobRequirements.jobType;
+  const evidence = lowercaseEvidence(evaluation);
 
   // Check each requirement
   for (const req of jobRequirements.mustHave) {
@@ -447,10 +471,10 @@ function countExactRequiredMatches(evaluation: RubricEvaluation, jobRequirements
       // Check availability/shift requirements
       if (reqLower.includes('shift') || reqLower.includes('available') || reqLower.includes('schedule')) {
         // Check in soft skills cultural fit indicators
-        if (evaluation.softSkills.culturalFitIndicators.some(indicator => 
-          indicator.toLowerCase().includes('flexible') || 
-          indicator.toLowerCase().includes('available') ||
-          indicator.toLowerCase().includes('shift')
+        if (evidence.culturalFitIndicators.some(indicator => 
+          indicator.includes('flexible') || 
+          indicator.includes('available') ||
+          indicator.includes('shift')
         )) {
           exactMatches++;
           continue;
@@ -459,10 +483,10 @@ function countExactRequiredMatches(evaluation: RubricEvaluation, jobRequirements
       
       // Check physical requirements
       if (reqLower.includes('lift') || reqLower.includes('stand') || reqLower.includes('physical')) {
-        if (evaluation.softSkills.culturalFitIndicators.some(indicator => 
-          indicator.toLowerCase().includes('physical') || 
-          indicator.toLowerCase().includes('fit') ||
-          indicator.toLowerCase().includes('active')
+        if (evidence.culturalFitIndicators.some(indicator => 
+          indicator.includes('physical') || 
+          indicator.includes('fit') ||
+          indicator.includes('active')
         )) {
           exactMatches++;
           continue;
@@ -471,10 +495,10 @@ function countExactRequiredMatches(evaluation: RubricEvaluation, jobRequirements
       
       // Check location requirements
       if (reqLower.includes('location') || reqLower.includes('commute') || reqLower.includes('local')) {
-        if (evaluation.softSkills.culturalFitIndicators.some(indicator => 
-          indicator.toLowerCase().includes('local') || 
-          indicator.toLowerCase().includes('commute') ||
-          indicator.toLowerCase().includes('relocate')
+        if (evidence.culturalFitIndicators.some(indicator => 
+          indicator.includes('local') || 
+          indicator.includes('commute') ||
+          indicator.includes('relocate')
         )) {
           exactMatches++;
           continue;
@@ -485,9 +509,7 @@ function countExactRequiredMatches(evaluation: RubricEvaluation, jobRequirements
     // Technical job specific checks
     if (jobType === 'technical') {
       // Check for specific programming languages/frameworks
-      if (evaluation.technicalSkills.requiredTechsFound.some(tech => 
-        reqLower.includes(tech.toLowerCase()) || tech.toLowerCase().includes(reqLower)
-      )) {
+      if (overlapsAny(reqLower, evidence.requiredTechs)) {
         exactMatches++;
         continue;
       }
@@ -515,11 +537,11 @@ function countExactRequiredMatches(evaluation: RubricEvaluation, jobRequirements
       
       // Check for P&L or budget responsibility
       if (reqLower.includes('budget') || reqLower.includes('p&l') || reqLower.includes('financial')) {
-        if (evaluation.experience.quantifiableAchievements.some(achievement => 
-          achievement.toLowerCase().includes('budget') || 
-          achievement.toLowerCase().includes('cost') ||
-          achievement.toLowerCase().includes('revenue') ||
-          achievement.toLowerCase().includes('savings')
+        if (evidence.achievements.some(achievement => 
+          achievement.includes('budget') || 
+          achievement.includes('cost') ||
+          achievement.includes('revenue') ||
+          achievement.includes('savings')
         )) {
           exactMatches++;
           continue;
@@ -529,9 +551,7 @@ function countExactRequiredMatches(evaluation: RubricEvaluation, jobRequirements
     
     // Standard checks for all job types
     // Check if it's a technical requirement
-    if (evaluation.technicalSkills.requiredTechsFound.some(tech => 
-      reqLower.includes(tech.toLowerCase()) || tech.toLowerCase().includes(reqLower)
-    )) {
+    if (overlapsAny(reqLower, evidence.requiredTechs)) {
       exactMatches++;
       continue;
     }
@@ -554,9 +574,7 @@ function countExactRequiredMatches(evaluation: RubricEvaluation, jobRequirements
     }
 
     // Check if it's a certification requirement
-    if (evaluation.education.certifications.some(cert => 
-      reqLower.includes(cert.toLowerCase()) || cert.toLowerCase().includes(reqLower)
-    )) {
+    if (overlapsAny(reqLower, evidence.certifications)) {
       exactMatches++;
       continue;
     }
@@ -576,6 +594,7 @@ function evaluatePartialMatches(evaluation: RubricEvaluation, jobRequirements: E
   let partialScore = 0;
   const totalRequirements = jobRequirements.mustHave.length;
   const jobType = jobRequirements.jobType;
+  const evidence = lowercaseEvidence(evaluation);
 
   for (const req of jobRequirements.mustHave) {
     const reqLower = req.toLowerCase();
@@ -593,10 +612,10 @@ function evaluatePartialMatches(evaluation: RubricEvaluation, jobRequirements: E
       
       // Physical requirements - check transferable skills
       if (reqLower.includes('physical') || reqLower.includes('lift')) {
-        if (evaluation.bonusFactors.transferableSkills.some(skill => 
-          skill.toLowerCase().includes('warehouse') || 
-          skill.toLowerCase().includes('construction') ||
-          skill.toLowerCase().includes('manual')
+        if (evidence.transferableSkills.some(skill => 
+          skill.includes('warehouse') || 
+          skill.includes('construction') ||
+          skill.includes('manual')
         )) {
           partialScore += 0.8; // High credit for related physical work
           continue;
@@ -607,9 +626,7 @@ function evaluatePartialMatches(evaluation: RubricEvaluation, jobRequirements: E
     // Technical partial matches
     if (jobType === 'technical') {
       // Similar technologies get high partial credit
-      if (evaluation.technicalSkills.similarTechsFound.some(tech => 
-        reqLower.includes(tech.toLowerCase()) || tech.toLowerCase().includes(reqLower)
-      )) {
+      if (overlapsAny(reqLower, evidence.similarTechs)) {
         partialScore += 0.8; // 80% credit for similar technology in technical roles
         continue;
       }
@@ -645,17 +662,13 @@ function evaluatePartialMatches(evaluation: RubricEvaluation, jobRequirements: E
     
     // Standard partial matches for all job types
     // Check similar technologies
-    if (evaluation.technicalSkills.similarTechsFound.some(tech => 
-      reqLower.includes(tech.toLowerCase()) || tech.toLowerCase().includes(reqLower)
-    )) {
+    if (overlapsAny(reqLower, evidence.similarTechs)) {
       partialScore += 0.7; // 70% credit for similar technology
       continue;
     }
 
     // Check transferable skills
-    if (evaluation.bonusFactors.transferableSkills.some(skill => 
-      skill.toLowerCase().includes(reqLower) || reqLower.includes(skill.toLowerCase())
-    )) {
+    if (overlapsAny(reqLower, evidence.transferableSkills)) {
       partialScore += 0.5; // 50% credit for transferable skill
       continue;
     }
@@ -349,10 +349,19 @@ export const transferableSkillsRubric: RubricItem[] = [
   }
 ];
 
+// The rubric depends only on the job type, so each one is built once and
+// frozen; every candidate scored shares the same arrays
+const rubricCache = new Map<string, readonly CategoryRubric[]>();
+
 /**
  * Get rubric configuration for a specific job type
  */
-export function getRubricForJobType(jobType: string): CategoryRubric[] {
+export function getRubricForJobType(jobType: string): readonly CategoryRubric[] {
+  const cached = rubricCache.get(jobType);
+  if (cached) {
+    return cached;
+  }
+
   const weights = jobTypeWeights[jobType as keyof typeof jobTypeWeights] || jobTypeWeights.general;
   const rubrics: CategoryRubric[] = [];
   
@@ -440,7 +449,9 @@ export function getRubricForJobType(jobType: string): CategoryRubric[] {
     items: resumeQualityRubric
   });
   
-  return rubrics;
+  const frozen = Object.freeze(rubrics.map(rubric => Object.freeze(rubric)));
+  rubricCache.set(jobType, frozen);
+  return frozen;
 }
 
 /**
@@ -1,41 +1,44 @@
+// Security headers don't vary per request, so build them once at module load
+const SECURITY_HEADERS: Readonly<Record<string, string>> = Object.freeze({
+  // Prevent clickjacking attacks
+  'X-Frame-Options': 'DENY',
+  
+  // Prevent MIME type sniffing
+  'X-Content-Type-Options': 'nosniff',
+  
+  // Enable XSS protection
+  'X-XSS-Protection': '1; mode=block',
+  
+  // Referrer policy for privacy
+  'Referrer-Policy': 'strict-origin-when-cross-origin',
+  
+  // Permissions policy to restrict features
+  'Permissions-Policy': 'camera=(), microphone=(), geolocation=()',
+  
+  // Content Security Policy
+  'Content-Security-Policy': [
+    "default-src 'self'",
+    "script-src 'self' 'unsafe-inline' 'unsafe-eval'", // Needed for Next.js
+    "style-src 'self' 'unsafe-inline'", // Needed for inline styles
+    "img-src 'self' data: https:",
+    "font-src 'self'",
+    "connect-src 'self' https://api.openai.com",
+    "frame-ancestors 'none'",
+    "base-uri 'self'",
+    "form-action 'self'"
+  ].join('; '),
+  
+  // Strict Transport Security (only for HTTPS)
+  ...(process.env.NODE_ENV === 'production' ? {
+    'Strict-Transport-Security': 'max-age=31536000; includeSubDomains'
+  } : {})
+});
+
 /**
  * Security headers for production deployment
  */
 export function getSecurityHeaders(): HeadersInit {
-  return {
-    // Prevent clickjacking attacks
-    'X-Frame-Options': 'DENY',
-    
-    // Prevent MIME type sniffing
-    'X-Content-Type-Options': 'nosniff',
-    
-    // Enable XSS protection
-    'X-XSS-Protection': '1; mode=block',
-    
-    // Referrer policy for privacy
-    'Referrer-Policy': 'strict-origin-when-cross-origin',
-    
-    // Permissions policy to restrict features
-    'Permissions-Policy': 'camera=(), microphone=(), geolocation=()',
-    
-    // Content Security Policy
-    'Content-Security-Policy': [
-      "default-src 'self'",
-      "script-src 'self' 'unsafe-inline' 'unsafe-eval'", // Needed for Next.js
-      "style-src 'self' 'unsafe-inline'", // Needed for inline styles
-      "img-src 'self' data: https:",
-      "font-src 'self'",
-      "connect-src 'self' https://api.openai.com",
-      "frame-ancestors 'none'",
-      "base-uri 'self'",
-      "form-action 'self'"
-    ].join('; '),
-    
-    // Strict Transport Security (only for HTTPS)
-    ...(process.env.NODE_ENV === 'production' ? {
-      'Strict-Transport-Security': 'max-age=31536000; includeSubDomains'
-    } : {})
-  };
+  return SECURITY_HEADERS;
 }
 
 /**
@@ -44,6 +47,6 @@ export function getSecurityHeaders(): HeadersInit {
 export function withSecurityHeaders(headers: HeadersInit = {}): HeadersInit {
   return {
     ...headers,
-    ...getSecurityHeaders()
+    ...SECURITY_HEADERS
   };
 }
\ No newline at end of file
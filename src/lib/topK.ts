@@ -0,0 +1,37 @@
+/**
+ * Select the k highest-scoring items in descending order without sorting the
+ * whole input. Equal scores keep their input order, so the result matches a
+ * stable sort followed by slice(0, k).
+ */
+export function topK<T>(items: readonly T[], k: number, score: (item: T) => number): T[] {
+  const top: T[] = [];
+  const topScores: number[] = [];
+
+  if (k <= 0) {
+    return top;
+  }
+
+  for (const item of items) {
+    const itemScore = score(item);
+
+    // Skip items that can't displace the current lowest entry
+    if (top.length === k && itemScore <= topScores[k - 1]) {
+      continue;
+    }
+
+    // Insert after any entries with an equal or higher score
+    let index = top.length;
+    while (index > 0 && topScores[index - 1] < itemScore) {
+      index--;
+    }
+    top.splice(index, 0, item);
+    topScores.splice(index, 0, itemScore);
+
+    if (top.length > k) {
+      top.pop();
+      topScores.pop();
+    }
+  }
+
+  return top;
+}